@@ -0,0 +1,176 @@
+"""Generate the static tables embedded into sol.py.
+
+The bot has to be a single file, so everything that can be computed offline
+is packed into one compressed blob and pasted between the markers in sol.py:
+
+    python build_tables.py
+
+Blob layout (little endian, zlib + base85):
+    header          3 x uint16: inventories, spells, recipes
+    inventories     4 x uint8 each, in index order
+    spells          4 x int8 delta + uint8 repeatable
+    recipes         4 x int8 delta + uint8 base price
+    spell rows      int16 inventory index after the cast (-1 impossible),
+                    one row of all inventories per spell
+    recipe rows     uint8 1 if the inventory can brew the recipe, per recipe
+"""
+import base64
+import os
+import struct
+import zlib
+from typing import Dict, List, Tuple
+
+SOL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sol.py")
+BEGIN_MARKER = "# >>> generated by build_tables.py, do not edit\n"
+END_MARKER = "# <<< generated by build_tables.py\n"
+LINE_WIDTH = 80
+
+START_SPELLS = [
+    ((2, 0, 0, 0), False),
+    ((-1, 1, 0, 0), False),
+    ((0, -1, 1, 0), False),
+    ((0, 0, -1, 1), False),
+]
+
+# the 42 tome spells, repeatable are the ones that consume something
+TOME_SPELLS = [
+    ((-3, 0, 0, 1), True),
+    ((3, -1, 0, 0), True),
+    ((1, 1, 0, 0), False),
+    ((0, 0, 1, 0), False),
+    ((3, 0, 0, 0), False),
+    ((2, 3, -2, 0), True),
+    ((2, 1, -2, 1), True),
+    ((3, 0, 1, -1), True),
+    ((3, -2, 1, 0), True),
+    ((2, -3, 2, 0), True),
+    ((2, 2, 0, -1), True),
+    ((-4, 0, 2, 0), True),
+    ((2, 1, 0, 0), False),
+    ((4, 0, 0, 0), False),
+    ((0, 0, 0, 1), False),
+    ((0, 2, 0, 0), False),
+    ((1, 0, 1, 0), False),
+    ((-2, 0, 1, 0), True),
+    ((-1, -1, 0, 1), True),
+    ((0, 2, -1, 0), True),
+    ((2, -2, 0, 1), True),
+    ((-3, 1, 1, 0), True),
+    ((0, 2, -2, 1), True),
+    ((1, -3, 1, 1), True),
+    ((0, 3, 0, -1), True),
+    ((0, -3, 0, 2), True),
+    ((1, 1, 1, -1), True),
+    ((1, 2, -1, 0), True),
+    ((4, 1, -1, 0), True),
+    ((-5, 0, 0, 2), True),
+    ((-4, 0, 1, 1), True),
+    ((0, 3, 2, -2), True),
+    ((1, 1, 3, -2), True),
+    ((-5, 0, 3, 0), True),
+    ((-2, 0, -1, 2), True),
+    ((0, 0, -3, 3), True),
+    ((0, -3, 3, 0), True),
+    ((-3, 3, 0, 0), True),
+    ((-2, 2, 0, 0), True),
+    ((0, 0, -2, 2), True),
+    ((0, -2, 2, 0), True),
+    ((0, 0, 2, -1), True),
+]
+
+# the 36 potion orders with their base price (without the +3/+1 bonus)
+RECIPES = [
+    ((-2, -2, 0, 0), 6),
+    ((-3, -2, 0, 0), 7),
+    ((0, -4, 0, 0), 8),
+    ((-2, 0, -2, 0), 8),
+    ((-2, -3, 0, 0), 8),
+    ((-3, 0, -2, 0), 9),
+    ((0, -2, -2, 0), 10),
+    ((0, -5, 0, 0), 10),
+    ((-2, 0, 0, -2), 10),
+    ((-2, 0, -3, 0), 11),
+    ((-3, 0, 0, -2), 11),
+    ((0, 0, -4, 0), 12),
+    ((0, -2, 0, -2), 12),
+    ((0, -3, -2, 0), 12),
+    ((0, -2, -3, 0), 13),
+    ((0, 0, -2, -2), 14),
+    ((0, -3, 0, -2), 14),
+    ((-2, 0, 0, -3), 14),
+    ((0, 0, -5, 0), 15),
+    ((0, 0, 0, -4), 16),
+    ((0, -2, 0, -3), 16),
+    ((0, 0, -3, -2), 17),
+    ((0, 0, -2, -3), 18),
+    ((0, 0, 0, -5), 20),
+    ((-2, -1, 0, -1), 9),
+    ((0, -2, -1, -1), 12),
+    ((-1, 0, -2, -1), 12),
+    ((-2, -2, -2, 0), 13),
+    ((-2, -2, 0, -2), 15),
+    ((-2, 0, -2, -2), 17),
+    ((0, -2, -2, -2), 19),
+    ((-1, -1, -1, -1), 12),
+    ((-3, -1, -1, -1), 14),
+    ((-1, -3, -1, -1), 16),
+    ((-1, -1, -3, -1), 18),
+    ((-1, -1, -1, -3), 20),
+]
+
+
+def inventories() -> List[Tuple[int, ...]]:
+    return [
+        (a, b, c, d)
+        for a in range(11)
+        for b in range(11 - a)
+        for c in range(11 - a - b)
+        for d in range(11 - a - b - c)
+    ]
+
+
+def build_tables() -> bytes:
+    invs = inventories()
+    index: Dict[Tuple[int, ...], int] = {inv: i for i, inv in enumerate(invs)}
+    spells = START_SPELLS + TOME_SPELLS
+
+    raw = bytearray(struct.pack("<HHH", len(invs), len(spells), len(RECIPES)))
+    for inv in invs:
+        raw += struct.pack("<4B", *inv)
+    for delta, repeatable in spells:
+        raw += struct.pack("<4bB", *delta, repeatable)
+    for delta, price in RECIPES:
+        raw += struct.pack("<4bB", *delta, price)
+    for delta, _ in spells:
+        for inv in invs:
+            after = tuple(i + d for i, d in zip(inv, delta))
+            raw += struct.pack("<h", index.get(after, -1))
+    for delta, _ in RECIPES:
+        raw += bytes(all(i >= -d for i, d in zip(inv, delta)) for inv in invs)
+    return bytes(raw)
+
+
+def encode(raw: bytes) -> str:
+    return base64.b85encode(zlib.compress(raw, 9)).decode("ascii")
+
+
+def render(blob: str) -> str:
+    lines = [
+        f'    "{blob[i:i + LINE_WIDTH]}"\n' for i in range(0, len(blob), LINE_WIDTH)
+    ]
+    return BEGIN_MARKER + "TABLES_BLOB = (\n" + "".join(lines) + ")\n" + END_MARKER
+
+
+def main() -> None:
+    with open(SOL_PATH, encoding="utf-8") as f:
+        source = f.read()
+    begin = source.index(BEGIN_MARKER)
+    end = source.index(END_MARKER) + len(END_MARKER)
+    blob = encode(build_tables())
+    with open(SOL_PATH, "w", encoding="utf-8") as f:
+        f.write(source[:begin] + render(blob) + source[end:])
+    print(f"{SOL_PATH}: {len(blob)} chars of tables")
+
+
+if __name__ == "__main__":
+    main()
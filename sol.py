@@ -1,7 +1,17 @@
+import time
+
+# startup is timed from here, so the imports below count too
+STARTUP_START = time.perf_counter()
+
+import base64
+import gc
 import random
+import struct
 import sys
+import zlib
+from array import array
+from collections import OrderedDict
 from typing import Dict, List, NamedTuple, Optional, Tuple, Union, FrozenSet
-import time
 
 random.seed("witch brews")
 
@@ -131,6 +141,350 @@ def mul_inventories(x: Tuple[int, ...], y: Tuple[int, ...]) -> Tuple[int, ...]:
     return tuple(map(lambda t: t[0] * t[1], zip(x, y)))
 
 
+#################
+# Inventory Index
+#################
+
+# >>> generated by build_tables.py, do not edit
+TABLES_BLOB = (
+    "c-rk<2fSQG^`0}c?<FCjg@htqDT;I(AiYYF4mNs;1Qn4^=%_RSDUqH)Xo^x5MLK~XpcLt#B-8-@5m1WM"
+    "y#3EPXJ_Zkz4Pwg-FJ6i$({Gxw|DQ}zW2`eo$s7E=U-+;wUnwgurF<2#=a`{)n#AZ_BG7DhTGQ&`<jCn"
+    "1N#r`vS615yDZpc!7dASS+L8(2;P*o%V|5I?Q+^Kr|ojuE~o8sdN}XO*kz1e#@G+WE@SL6#x7%q@nKZ#"
+    "_Z9nn#eQG0Gb;A`N;e-~m;J8Ge%EEc>$2Z<b@3s0+xgvgez%?9UExz0X6FsF^M)Bdo#FQLaLuPR0{p4b"
+    "pSCY!Ulsf6vafFY8fIU^?P~;|zWoRG8i2h9V6Oq#YXJ5dfV~D_uK`^id;Vb0AME*qJ%6z05BB`Qo<ChW"
+    "d+uP*9qhS-J$JC@4))yXlG^hId){Er8|-<5J#V_q_ME|<GuU$md(L#(?fHT|U$Ey(KY=}0u;)rYg+0&u"
+    "&p~H~f5yHl_SI!y-S#!izJ~M9WzS37gV*)|wLK7RcdG49wB0cMly)I)C$v2$ZO=*DbJF&l=qI-4qwV=<"
+    "dp_EpkGAJSKf65_ZO=v9bJ6x(=r*wDq3wBSdmeO4*mKbK9O%}t$6voa=$F7F#=nYvb=g<9eGTJV#~!b-"
+    "$7}5I8hgCP9<Q;-OShCgR%4IV*n>0nK#bin-DY-0V;3;?gR#d+x1BvkV~^3;W29Tq9-pztN4KIqw)*Wz"
+    "cZH@SsnB1SeRcC~YLBI2kELRdrDBhzVvmJxU3(lAdmI&e92I*UbSv9qsMuqu*khpE+HRm?7pB|W?z?`A"
+    "(;cYkth;D$U3}ZyeRbJ=b=iG&*?rMtVE5By_tRzfLyv^rN0;3PJsNiV^~ZzmXiZnK8;>3z7rVV~yS;9^"
+    "J$iKPwz}=M=n=BpsXs>aB;Xxm_>r>f4YTXfqh;5rKVI~-XnxG>GWACdpCI|T(bJ@XJAw-EL){Jhz~b5?"
+    "_>rUs4j(9dXz<~{2LW$<yxE8IBTF|g-k^9R;!TG)8QxgK_;IG21#b$x0q_UMAGw<!bNcb{hr%BQe~d1E"
+    "^yxz5g~f|m;jVx#7G5C3-2z<%&D{f@tm`7^pf&K0E5IA;23}z}cOlg5GWNV|KVn~Y8GBx~AK~r=zq03K"
+    "`w;uG-`jJteF%3uxQaa=+ke=X{mz~bbw#)tdoH%`u&)YtO}JTm9=6}$ZVGo{&w;utyQ_MaMZKD)CrZ=Z"
+    "+(mbV#$TC!0X!u9v)|ht+5W-4y1ARf!?gcw-(X+%JA16u_2Hr0<Fx&PeO0(C#8a`yX!`{27V)&~@lp3^"
+    "kFDNCQV*-?={EFa;T_-2T_;^NJQDn~-`QiK?i4SHJr4Wa+gF9VSG+{_3;WD-SBsa+?w`6`yYG6pOTD?K"
+    "o}@xgaTj;R^y_HaO9lV1YsO1#_hX-H?xyi_+kH@XZC9vw*@O<7dZsSy73l5-x^i83)YzTlPh+=5-MZaQ"
+    "y=x~_!5-LfH&1tm=I-9EQ}6N#c{F$Zc=x#OAJIrc0R7BbGw4<{18BEqa2(DML3f_k3{DlzfP;G+#_&M^"
+    "fgpgLJ$CHak#{q!P-l#tE_Sfkp>{FUP{)X!Aa;5ch92s`u){J8L(~Cjh9m4$93;_$uQfls70nMMK7hj*"
+    "uIMSznjeOW<{Q16VT}Ipro<Z%Z@4aoHo9@}Cc&Gc!ca#)F#e#1VUK<w&G3g8-9aE-9Ig38E1FNDo1u{o"
+    "L~GtSZmf&pl4fGF^X+jEeBxt*AMG&^l;R^}zamJr`>w+(F$hg4W(Y;P7;33k&~%p@ybI|U0p2A3Aq?Xq"
+    "XJ-%`+wIpOnHY&CRIDH>QI83H2>8^{FAH=y1lx8yb?7E0gNJDt#;I4*4Ci=-9i$W6(G2a_YdLsF1|%V#"
+    "9(8S)1Xc_aIz*mf4FA;IX~RURVwn7NGcBNBQyV57c%)rS6^IbvB}0&}Fm)hc#!G0JMi6*vrV|K!j#3cF"
+    "Xv08JG2HogGu5D8R~znh@rmzZ`ayS;Hr&Zon2yjN{yc`M33VQtDGEOLj;7FqrVT$d_<(dVb)g$t8@@>^"
+    "Ol9cC!k^eMt)V?=rZ@P*If_FUOB=ob6{b9N(0G7`=?`sKGY!I-jtUVQ#aqTOEh2Q$OpowsaTJLdt7fW%"
+    "=;P=TvRFx(sB6`{X<|FbNV=Iy5n^fHCH0(LOt0vP)O;9t=g}_+e7oY2(jU;R%ftvg4I_e}`Opc>yO^30"
+    "GHN~@?4hYw0>0((>7Y9V==SH%A3TMlj!^R@zz&Q$BH%{^I}qv!fF2iqNWoJ*x@qy|G)(*G#?egw@P~C2"
+    "kS>5`Du@T@=peFxNeKy7H2(y&NEg#YLVC?V3!)G8vcQijKKXRl13k7(T*1>xB2=1xN+dr-R)8OEL`dqb"
+    "fgW=PVeqt*00JL>!xWS{V9it%J3vQA>A}@ZOYy;R)D(YoNlyv-G~Y^i+QhnmyAwoeLJOd-g^dC5G?qvq"
+    "b~%PAEioO<)E0YjM{fzxG}BxJ3rBUaW07>1;1#<q!_=1;lV%Exh~Q{25mC)_7#WqL#0Z*_785LMrpL&-"
+    "97RSFD`_%9cAY8{cB?7`|7Rh^G*z}mYZg5Ar}n4rLB#B#ZnFxe2LW^zqgE9@MSw?KrH8Y&p01g`st4by"
+    "RV1(4{@3<1%mT8B?e=gIJ7n5B;;!91;BpnP|2{#i{*(^K(9(9#pJ4ahqpG;WS@y!tvL9z*kKdzd$36Co"
+    "9!-Z(g`OV!3(V@l%l@goCO!6OhWFUh96rlVjZpUMIh5VW9CnEw`)`&SX}|0lsqE6D>=HerlwH|Q%~EsP"
+    "`8{*lC3@zv3(uNM+4bhO=lJP7cDY&e*jYXE+C^rKw(~w2(^FMdyZLH$RMq|;)nj)wr+xLzZC`dd`+2^q"
+    "ZKGz{e{)ss|9PtR|7iPZ)|ijs6Zq6#mmYg56oEW0iU8VW@2+8bxE`VBpm`(pC_Sg1OV6$6(eu)r(Rw~T"
+    "Mvv9=>jmiZf_fqS8NIMxggz~*7t@RDC1`p{{aO7vnp#RPP4COle{Rd_&+9Mf<@6Wz@_GfmB7L)xURkfA"
+    "SJhwAU)EotIbYRZ)2r##^&0x?^m$FamR?)0qt~TR>*@9N26{u9-bin(H=(I-=uPQ;GqJbL^%nY@dP}{P"
+    "-db-%^S9O8>FxCndPn^&`uuJE9sOPXJ-ris+F9?Sch$Sm^zM2Oy(dlWrT3=yabnBg*Zb)4dSCqm{X?4j"
+    "BfX#gvEE<*ggzah57Y<ggK7E@eW*T+rViH===}(>og?*8`e=QOK9=Skr;pb^)jy-@pX(F!i8OVRKAGN6"
+    "5$pXzpQ=yOr_-EY>NE72G<B9fo8BjiC4Z&Q(dW|V^Yr=jeu4P*LVXc^nk42;7Spa>tS`}1^riYTeYw6u"
+    "Ur9^+TK`60rGKk`r?1x6(41@ab^3aJgZ{n#1AV?x|55)*-=zOcpKjK-=v(z|G=00iL*GeLcj>A0ez(}`"
+    "J$jnHSN}!dr|;Jf(EPvZzv&0{L;7L;2z~y$epElEAJ<RNrziDO`f2?PO+Tyuq5nx!&*|y(K0|EzdHsTZ"
+    "QNN^L*00dqnfg`zntomXi$49IenbCTze&??>9_TNXzIWE9eRIPZ09}wzW$&7Kz~T{KGGlSPxPlWJxllK"
+    "Dor7+!gp=_dX^8EF4IkOhMD1J1WnChM$-EzvE-a)E;BcMp2y5f@1w=H^O-U9X{?wxze)dY3z!AXLgq7O"
+    "VY7%?l)higEN+%COPbG`&(Y_l%+h8Vv#j|%efok~&V11<Ptz-y70pUCwX#`--d7cS_>%du`HK0f`I=dc"
+    "=B{qmFkd%onziWD+GZWIu33+!*EbuO4QXm4voXDIBDV7lv#Ht4Y;LxodEYc!nyt*%G`)@4)@(;p+nXKe"
+    "eMhn0x6HTAcg%Nb&iBktW@nn(#q3J&yNM-tH+z^p>GNJ@Z+agmzWu)0hdzxL^Y)Eg$sd>>nje|{%#Y3f"
+    "^zBc~0p>t+kU5w>9byhOhnd4^dV)E^97$70nWO3b7_q%$&2i><^HcLPn)h>af;rKgMAIjmQ_L@D>Qr+Y"
+    "y`L`D`=vR<oN3OYIcJ-R=2tXzjyad!&l5|YZ!Rzw(&vlJBzm7LzP;F7LZ7CHd6!1c_cC+2xx!p&eof!~"
+    "#$087Yko)5SDS0hwKR2|xt`u{5bOWm{K4F4{z!BFWNtElrm36FE%bh?Sn@V=ySalt-)Zim_o?FByUjiH"
+    "X_}aKZ{#@tV(v5dn+NEdznZ_92Wjdd^Dw<XBG&l3dDJ{cpC30*(EF3(+o#Oa^ywKf@7c)y{$c)Uo}>BG"
+    "%?x^fUM%&3d67Q7B<8&w*~%+sCe3|SeD_*pxz{7}%2u|%xAoNqYD2Y=+E{I(zM(c%o2kv!7V4X7OSP5S"
+    "T5Y4YRokiU)edS$^)2;n^&RzH^*yzd+F9+Qc2&En-PImyPqmlYTa8oSSNo{(YG3sO^+WX|wV(R2+F$)d"
+    "9iR?W2dRVAA?i?dm^xfdP)DdE)luqbb&NVz9jA_0KUF_dKUXKH6V*xTWOa)Ag*sK8rcPJCRA;C&)miFn"
+    "HBtRaoukfG=c)761?oa|k(#6?tBchoYKpp4U8XKqSEwu1uhnnVRqD6ucj{_&jk;D{r><8wsNbtUs2kNE"
+    ")t}T&>d)$Cb&I-H-KK6=cc?qnU23YjTiv6kse9F5)P3rH^?>@T`kQ)CJ)|C1kEp+^N7ZBMarK0HQaz=f"
+    "R?nzs)j!lf)pKgPnxURoFQ^yQOX_9yikhijRj;Yn)xXsLsW;TW)tl-q^|tzt`mcINy{q0+@2mf*57dY1"
+    "BlWT6^`9cmS8NAqvfsO`oj1(dQzKvw7zv|bPM8bkhIwFK7!C8m7#Iul!ve4%ECio{g<%m`6n20e;al)+"
+    "_zrv*z6U$O&aeyY3cJDXum|i3d%@l?4!#fjz<AgfegHp&AHja`W7r>l0tdi>a1a~}hrpq57#t20;0QPp"
+    "j)J4%7&sP=gX7_+@H6;1oB$`nNpLcp0>6M$;WRiMehFv5nQ#`I4HMy4a1NXc=fU}K0bB?d!6cXr7sDkm"
+    "1ulil;BvSEu7qF1Z{RBUE&L9yhHKzjxDKv|8{qfw2e=Xb2!Dc`;LmU~+yb}4ZE!o>0e8Y(Fct2Gdte&e"
+    "3x9$8;C^@j{tADC2jL-j7#@MY!=vyRJPuF5lkgNg4bQ-{@DKPWJO|TZ20RZhz>Dw_ybQ0vOn4PugV*6-"
+    "@PF_I{2Shcx8QB~5BwM2fp_6Ocpv@;AHaw35hQJq&<>F{h_^qS?ZI{j+8mqd(8`b&hPN)9Wx-YjS`_27"
+    "v?09x;A{uB8_;GrLVGL0SqN+$pk;81cD4Z90cZnE)Xe&k@n4{k<4@9)b;znEqxNjtF==Me$e?Fv$(cQ0"
+    "c3hcxGIHd1wP(eS5i=WBB>g$=%e)sk?<m787a8togPeA(ncqle=~<;?l*}fPNp501cXYgwIV1AL9gSm%"
+    "%np$m?q-+^A`cvAkok=_`x?*492;XMhAixK<9HWyF63M18D?0>t|lAgQ&Y^P#_=BJJji!$HOz33-Apye"
+    "XQr8Z4YLqrAWs_P9M70%4YG!p%**Dr0fF`-)hIQmnoG^C=27#i(P}<5MvYbTs|D18Y9aL*wXj-5Evgn%"
+    "i>oEnlIpYSb80EIv|2_jt3I#3pq5i#RLiRs)QV~)wX#}8t*XAHzO25YzN)^aR#U61HPqMDnrbbzwpvH6"
+    "tJZ5H<`ji6ts+W(49Uig7+Oe_V0>5vI(wIV9=-s}!53k9SOHdqm0)F91y+SG!I$AH@KyL4tOl#Y8t`>k"
+    "6V`&YVI5c()`Rt71K1EYf{kGl_y%kWo5AL=1$+~>gsos}*ao(R?O^-D@T^t*%8yvtC>6sdiAjt`AGYy#"
+    "OKN+et|v7;uje@}k99oM@Rn&A8S`UdHvYv>Pof>;+$3Gpbqkd(scLye%c)tcWTA?6cN3VJjiWL2l&Hyg"
+    "IksiAkQ$KJf1LKix({kTt2V&j80t#2Wt<(~#Bq96#VIPRrl68?Ocb9bE;AxeX|O-1Ww4Hc8paI)YBOF>"
+    "i*AJ#22>XwsbTmt!E&exJa3%!|7x#C0^|`!&sMh@riQB#YK{o%CNVceT#2_HZ5`G!(jv~Tt71oxw*Hbh"
+    "9HOwqV2{8Ke;Iuddk>B5Eou9OxGYiGW3oeJ#$!a|%TrqpEkB9U9-|#XGd?3a-=ElywEH|_JG^GJMy!4%"
+    "SkGI14!aq-5w|}QOFEm6F&q(mc)iDGiw}`}bZs8mdkfO^!oA?a;;;lP37>_}!BVg^ECb7?a5zL^iNPL$"
+    "9sV-<BKB?<*<aGq3~^bavd3hH$c)E`#>b|%9NL)@r9DPFgl2q3biO>X9cg8H#CCYiXpLBXSFoP9F&%a@"
+    "awBd(DVB5=CSy1v_$&2q*}g<1f2%eRt;_dl`h)22mh`-ZxGYiGW3oeJ#$!a|rBetOTCftOJw`i(W_(6;"
+    "-ZZftX}@~Jc6iNbjaa>Ru%5SG9d<KvBW_O+OFG+?F&q*6<odU4xgwIEU7Lq?EBmP~ir{(Zg_0=kG1?(C"
+    "<1?c3)Wnvg9qbX?;WeW*V)gW3J#Pg&>}KRf+<r$a>1<%ea71vZ;{aR0h~y({^U(ff|IU~cT1elGM{I}J"
+    "jMj+Ns|0I$>)By9BRAsq#$rilJ2QqOg6~lOmMv#Q@?C55&~9e$$v%nW^nMYC-HhCb+eeFKot4cPjtG8Q"
+    "{ad!N5y{W3%|i>Dy%(1R`*U6i#&AUN>+9dM1&&C5OKl$7-|SnsM{I>X28iSj*XE*4&OU*s>&v0e&kFyG"
+    "wRtm3HNI?RD_hxGZb{20w0fk)<E<TM>9Cc97S8Gk@0GM&yxrn#7PeQ=R@p!BLwP&I*&u9xpzSe9_?4Vx"
+    "!Bz!Y6jSToBDNUNT9{t*1ff0f4*7ZjMncHfC0F-6-Enm0=g7^s2)sO=cRS9_d>gs;;lgX<m^8C!WYCl9"
+    "z8Gf6$c}HW`B{+vK1`mJ>F`<*8|K-mW2VeXk&!MYye5usGS@_&xqjUj!aNc=<SsQo2eQNi$&+!sK2^jM"
+    "ITptZ4%yo+bx#GeGh}8@)w~eMz1|={!^gT(k8WXhgv@BUn)d*?&pPBE*wTEv7Q2D`<WN%kPcUate8W}d"
+    "59YoBf$C+1)!>Y<>TE0Hxr&PCYG0e(BE^bogC*ju)z;}qwfwD^n6~VeH{vbUnva4@N6Aocl29<I?+A2E"
+    "oFhGq_}P0I@ssm3;xv03>A9_`oW}|EFBwmR^Fp5_&XIme{Oo;`^jy~TPtrk11*IpYriET1_7+Cn;2i14"
+    "Bz2^&jp8Tg&!p#qbW(aQYHI0Jv1J*TgP*<ElkVS|eo86|si-*hL`_S5N^HkR?GSgUDXVmck-kdzRZV4`"
+    "Db{oGJj5SJb;YSSYufAEVo8qjAtq5%W8W9wV%!hDOONYE5w*4)qcAwfD3qMGC{8=OalygDv^vdnis2!7"
+    "`9n4vh()E@J2~Yew-!;tPhPEtv1!&468>^~x7U5<)vAk7v;8^w&a2gR$bY^bd34jUYL;mv{N%QW4t(YI"
+    "&J_M~d;isa=GCf;TC*I3eCM_&Cja?iw6|pZn(bW!U%BND!e4HgL)~X?@3NZT+_DDpom<X8{_`tn%V9)Y"
+    "wJKxU?0r=CnOCbWuFc*n<U6lc?<4>D1GF6(;b!r@?lZT&Xw7eKe|_?u+h3gg=QC+NAMa-S$(rBXVm0~B"
+    "Ek2X~{9{_u#lBUm9Q|hdKk}cCAl&9CxN3D?@}JK~^A;fg`9d`9V&c-VYSn5oTFv%yfv>z;l@V*zs*hQ-"
+    "m|gRmSF0SiW-*)m=iB$fGLsxLWSEj)dUol!B{R$8qU<r`j*>Zg-so5(bH*zo%uw<|&k7wUWJWkO#r!<)"
+    "bF7a!-%|;8=eQj+yO{xtV-EMWU~KOP3@tr2H90ah9G5CbrTQ_cZbT}NM_ne$=R!6oxtwQmj>j>J+bqJ>"
+    "BvbP|&9OA*XyZ~`%rh~^!<dB~k>Fd7Z86t6CE!)eswN5!bwR+Hl1gHzBT5y~Ylu!kWc~2&2&0mG%CjlQ"
+    "rI<<0NHHeQmmFJSuJmq#6**4Cj7SIUhq=!v!E{Ck%qCRDq$cJSF{g*I8n$YR>3E*wSPpZXO%iOzaT#VZ"
+    "I|i(UIm>Q>p^OU{iPVO?GURk2R)vm9uoA~fn30?wun*=Q=Lx1UIbarERdJdMD=IexoPrs}t%5&H4fujn"
+    "FIc;HL@<OW14h7V!t(+8d;348c*ivFwCbJIy+h?&YTsV{4)yQeZHBbfkhB{@%R$->-g*e_hu-Xnq$LsB"
+    "64ILR_C#n=#4U@^wvg6^w=Y5qBW7txTf<u$p}mo|JG|u)+8#+8B(y@BRoK%ycv=ZhYT=<8F7<G)h=-bZ"
+    "Z}w2qA_{FHX%%_9D71{?7E)*<Nh`_QNui|_vzVmK<gKRAZc5uv-hv8ksH80wT2sv`>`84rsg8&GxKzl!"
+    "Mjoo<aT_kQ;-nqtExFK^i`jJ2s`GYTXxXJLJa6NLR$kKD3+=sT74}dq5A|}Xn0w7URLx^HrL-!&T^U-I"
+    "X$#Zan4y)Kv^GO~vsr~*s^?Na_X>Kbp{H$FZ^edoY|@?$E!t)kcCV#-H9geRlXh`v88@r2J6$~<ZQeeG"
+    "y>Bh4O(xaJP@j|vrPnA!m9n`OYMP;{DRoV+Y=+uq{w7sWse^hYG}J=#HLsX@%`{X^8#kw`hRSMoo2;w-"
+    "+KS>ija#csD7)q7Nxiph1{H7p8M)9ZH_2}KnM+15l*wu0ZQp*nlKJ^XMvPG=^N6=g`{8`E8AH6?+u`GU"
+    "wu}W2TH0rt^q7YJQt2)AzEbBY-Lz?(NqSL3AFA}AdjF~Op6=b$-a_UgS&L^Zj;&0{y=BQqJQs01<m6o2"
+    "@l3<9jI$fA=Xk{VnM+>OHr!9@FQN7#br-L>IK5?hQ%4nQFH(2$nv2t0-pRdX$wxdFaXbWa^%9<GIF>Q8"
+    ";d+io%$vF7n6~s%p&BBU5U+wb1!UvgM<A6DuYx!QWQSba@l3<9j9nY9=Xk{4nM>|d_?47;h1V*aPH|eU"
+    "{dujz=@jQST+i`{NtsJtQt0`5jlt;)w=~?o(--c_T=Jg6j??J`Ph@WK=|cARVn4Enn8F^@*wZR|QfCj9"
+    "cB!?;)pp;~8hcu0PwMQU(k`|3xZ3VpQe{u-?4i;wwf4B$?ptVoh8C!_K^s}2(!P`yW+NNZ+mMZ{$gzdo"
+    "acPY`t+FR|_E2e;T6<h=_bsWiCw2BvX_s1iTy6I))Y(I&U25%dwcR&q%}RT=kwxn*)<!n#_(FcSq{^Pu"
+    "*+ZpWYVC2g-M3I@50!SQwa3+V-=xwmwf4B$E|{tDIF@Y<PbuU|hB|wwv`ei$uD1Iom3FDM$JKV<yw)C9"
+    "+Xb^O<b0*lF17Z!+U}dz+T&`wZ_gBRoL*~>tL?tMRLK5bE$#mS#9)dV7gtooaH|o*`D22!<A7t)zhj5+"
+    "9b42WxK<;b^T#%4$1}&Gn8y#w->ubAZ~3FIvm>r!an@4?;FZij&MiCQI~M0XtzXVJdu&@QlKh!A9%pPs"
+    "Tgd=spH@`FaH|o*`D22!<A7t)zcT9g0$u*rvDRv&bN<-o?0Du_6tj$89zEoHk^Iru*%8;VIBOYSJ#Nrl"
+    "$?S;lSe&<v@18tB&NmiGE+fdNcHlT=B>Izu?C<%4k2*ch7h7_yZxS)M$uYm!{J3AT8AM*jahWKPj=D?7"
+    "-6bRM!q__*eb*@dE*WE&jIs;k>|~@}qgcBzrY?-ClW}#8BI{%nos6Svgr+`nu2Jk<G4XQgaRcr2X(VIp"
+    "it}=WF?FqbJ!BMJGd>U>IoC)HDJEVn8Qou;-yw{tYuyhaqv)FPO8CgRM*2iC@p55Qe(T->8AaEO@4!dS"
+    "HBu3ZiI<bn_04GhK60*+^<PZ9oR67rWW^T~FZXh3bC<1bWh-0R22l(1l*kMvJ~xTWO2YX_FcZm|K`ktw"
+    "SHxu$;ann^MdUzH-O6PJ;d~&N3FMM`)hf>IfmuDK)oM~<rj8e=?$rCL64Y?=`7m5249<ap*)O&dRhe8i"
+    "3(jMK87z*hS6kwo6qt?Tl3Fb#%rJ2q)k}I5UI4GoI$f3(S=3^etXCRhwH0;NjcRp-&?4TQY6Tsle_pT9"
+    "!|ERDdbii=@1Sz`EY;X~OV84*M4<+?0@brw-)uv5W+s@E&DAEB_bZn9E1ml*nf)uw|0Oek`5a(j7O*Up"
+    "AgvK36@pM7km`Wf24c!U`$pjvHNLLZ(R2C7$7PR#%WJ=vc?7a7{ehcDpd8s>)X4tXZT$UU88_eQ@$bcq"
+    "YA>b|YAj1gr(>AYJxn{}noGs8D8(_Isid7z)XCnnxVY-sO*u{GMJX;~JM8gWkKi6G+HRO}rS(W~i9pT7"
+    "g?Cz8mYG|ci6{4n*C?{A81>p`d}$PeRt$>1K7cg$Slv`>NklTkrt`ukv%-csVP!^GpAXh$gXLVXTuC)u"
+    "In|<UDlcp@D{Pn(R%V3t`Cwf(Sk48@l~j|pQ>)cvR@g8ntjq}O^TE1ou$&8)E2)OnQ*BQe<b;(OVSPSW"
+    "mkpM4!Ez;4SwFQ}l^J1uK3JCxmUF>!B~@QRwOaN0U|lv?&IQYrR9y{K`}^0j!E!EGuB6IURI63a1<RFG"
+    "v5soB8dg$GS5CDoFO?TInH4t72`e+g`h2i18!YF7<w~mQ`UA<VuwhPEnGx3KgLT<pITtL~7)VwX2y?>9"
+    "jIcf*tjh+=xnQ|^Kv*w8W`y<mU|lv?&IQZ00c14*pAXh$gXLVXoc-VD`*+!3ITtMF_;*?TITtKv^XL5i"
+    "VI|dM?bK>DnH4sS@RaeLKDyJzc5-AVS5i&teWB7PH9oKIIbDwxJ=XF<%}%OyUZ-;k9cy!}%1QOj>uyeQ"
+    "W37!<Hm{~R9gP(<*3O(p#_AaBVyu6Kl~j}YHp5XgGEUM*NxB$Gj*#RLGojWcRW7e@Ic1AAEmpInYUTAR"
+    "r&O^<#p;w-p`8B2$`fl&PFrGCiS;DbjlxQ*q4g)NK5y+gE03)^w(6wC<}Ed6p|NGg7MZuUoR!7a6<bx#"
+    "Vq!~)EhM&n!b+;r((o3Bvn<%6U`xVV3C=oTtAMQm$Ml)uGqY#b9#&HI4B0VbX2i^d9m{2Q%dD0eYgkFu"
+    "u|sBs%m$h1g_Ts9RrOX$^>CF&xLEG<boTRP{_`*cy3B#@v!J^?=q?jFw<}c=3)4B$lUdTkJn1r1y3dvF"
+    "vZcFx=`|j$Lc~nwQ4cez%UtR{o4U)V?lP*^*r1Y_8s=G-nbv)-b(d}3<y)`yxXL50%)#!nu)93$E)#oA"
+    "+XaWkJ~z9|&hGNFa~lJU&@NxQ%h=BCGq7-wza876kxDIPg`L4!VW+HlQ&i2H*{w3oV5un6>B=z0)O*QW"
+    "(Is2Qh*jH&)!Rr{+(_2k2&-<$x*NXohO52ds&CZv=#Ex;Yaiwmg)prmN`4H<#*G+Sd>BE7bj6SK2)^VP"
+    "zHk(u9LMKJ^0~2mZZuzSu^mNKbt?+bTE(yYh?R{}F>H#(Nt78Gipt0^yJa#MEO`PtJx;%vQS^C7zn5d#"
+    "%T~6s`IfG?n5?xJ)>)J_7JYq1S6h+mDq>B=byTv7Vpu^@R!{Vm6J6Cru9%3`5)V<KMkv)muM0XwkhMTm"
+    "0WVWh+4Gv7Q}bBILj~_X<#joy$gviOD%{J;scWpOp`!MoVyz5SvSEM<*u1a+B<-Ql5|TEMw|<=6!xj(P"
+    "I@>~M(@1N^+cD09VcP|*mSaF#C*Ce`775!TXoXw`-r8_>23r_tTiglGhG6Rf?S?0S?E|z7UIw%P-h_7{"
+    "<nWTcd*1FCJ9Bkp=}T$J#yt;r44k<)vhHta&#oP>W=4%%dN1ubGqYvn$%kv^!^nhB(#Uwv(&uT(Sv^~I"
+    "Je3(La?`uC=b(;#GVesj`J8slk~t-^$^U9*jmQ_3L0&kAna6l$=Qtg+IplFG8^_m}sUb(($S@Z}7Ph@X"
+    "wzZ4d%Q(KoObI#CQHHq?vY=B9vYm6xMTYqbGL`ELGLoCkod!9@L*{Way+r%64U(3Q_(<YXh)NQZJR&(f"
+    "Vl+Z5T1zG4I6_pCnB)=3;Sr+|V$nef|CPifk4O%W7>y8%rUX7Gk4O%W7>y8%?iKzbhewP?h(#~feLjpv"
+    "h(-Ua`EL-5y2vLpH;je${YJ^iiV*K4+Ig&VNXIybD7Q6)F%uH)Jk~j+W1K^jJ1X!3d8~6t$2f;5H$`}G"
+    "9MUn)A<Ere_rfsFA<8{g^Qa)oy+~e?H{id8UCA)AL87L|Ooy0^mxz|14aO;X%yfv!c!_AavGB7v#ALig"
+    "wA`caD`C7uv^=!t_dv8ffqWTf=yO`mVIkuUJk~m-Wt>Hny+e$iaY)NJizxe#x{rf#7E$)?n!f^3wnw86"
+    "Vz`;B2~_iu0S=QHkr9tqtVe7!A|oDeQ1d$=9&by&gq_SD4ff}}`i$3z)<@K$d=afrArHYsb3t?~?4d^l"
+    "zlNetZ!)(B%c1Z6Z|2duhrPFBh<VrBS64jN(!TYgs*guBlZ0oz)%xTqbtLes=dWI#c-n<mJ-e>CY~H6H"
+    "t9G9DsLT52p+CKmH@%T>y{PKrk$WWJS#PyId9sCm_59V#!zR7z*>%l>d#3JFk5xNQd(>t9^U$B($eW(!"
+    "S#PyId9sCm_59V#!zR7z*>%lj^FH-hwez$`UDiJj{ppRo>Am^Y^H(nqoAjz@*EJ7(V0E8*tlD|nqb}>8"
+    "hyL_N-t?GPJ-e>CY~H6Ht9G9DsLT52p+CKmH$CZ7k5xNQd(>t9^U$B($eS)b>azZM=udCtO?UqEzIoGU"
+    "r&dP#78U6`RNCwou{`kGV2P>j@7C#<?)JB0qQ;AAd85ypZ?SmwMr~$^;bkjZ*~-?oHoL_Q3>JTXr~UTD"
+    "c;oZ>+he|U=TCpU3Dj@jIPQF{sL|eyTdU*2vs?br;=Q-*apdt98(p4ma=dxi7Ve|Bu&B}AIqr}a$Af3L"
+    "{G-KtZ`tF>d%0gCqs!AxjyDh62YvY6T2+a%TYe3x_m-_L#am2sN;j!Og{@UhD!=y9d&^d3;w`4tq?=T4"
+    "5}vpgY{6{JBi>?4NV-XFBym4Ad7LpNBHg4mk<jv**q>Am68%Zetvp>?<o(`~;{d}EfO71gANA+P`|(IW"
+    "9OJiLVl1B=#plQGxsiK3W)DZ}9UJ(oJyJTHWRygVyj=L39o8|@A<o@Z_Zu^6A!a>U^8+Iey+Z!ox8OY}"
+    "fAK_58hCG{@5Xy>oZp7MHt4fiIvADbeKXE8!+sg`%4{mU+YVV7R}oeBu6wB&BM~7d)V$7!dMA@N`D}gu"
+    "5U!jj{UzR8;(R6SDM3HUR58lVc|_PBg5Hqnb^kY`FJkXIHGekZDUhFfq?vaR^|{`2;rtftwLqW6D)q5*"
+    "?4LmI#KtwhIO6gS<nP|q?A`C@>pTnWS3s}A(Y0}L=tDS-{N(4FNo_q&_6DFY;CdSQc8j^IkNZPS|6!3Q"
+    "FuToYxLhp1ODw}nI>$>g%S)K&MP_>OxnAP&Y3Zyl>AWw=%r9Z?7n%LV=YNUEtR*wSBy+)p*<fTo7@rZQ"
+    "aTFUinH@&vhw&L=Vo_~jt{9mu#^;Mk$G8!@u4j(%xnq*?ZrofJnK1IrwMBEHbvo-ydQ^ULTz)t*UyjZ9"
+    "qx0i2YspM7$&vfv*nK&A-;dvK9K}X=mKfPD$M*Zt{jsRFFjtHm_3y|1r(@i(`OGms8$dGNjho9N6VDLv"
+    "QO@73tZh(KZG+jZCct3HxZmlF_r>I+f3~#C2UJUrt_sIi$&polT$LMD#bc^)MAaIJu~gDe=Y4d}KgYf~"
+    "^vnGu@QQeUi1UQ74+Om*lLdowtc{r(va`GE+=}@Wa;O<K2868VUE(a-GLG^W4_i2LOX@XVt8qFFYc#0O"
+    "d@~rS<<%Ld%&;nhip&Jzzi?^{D>10TOs;b)=2OU_ZmBUKWIc}%XPIFc$I$%+WX!AAOPp51Itgkdi;Eam"
+    "r;o5Ug1X2Cb)N$(BB+M!T4O-SdJZDa@>9z=2G5o8v7b)GU<Cu!i(Bgvovd4+X7O~*V}M%4zlpPaqPzMX"
+    "Z(O`2>kX(ie6bb_i5kPYr2KDX8Am&hfnyO-D>#gz4No*@_Hln03;0`eW6rJI-*CBD#<p0_wsh9EWZt$g"
+    "bDPZF=Cikj`P*De=W$DCa!clN3$wY&d~QCYTYThG`>e>KY{ph?#Qauawk7ys&R)N>HTv3DkFO{TwN;BW"
+    "zYUsgcTUQQG3~36S5!T`R&Cw<)@`;$J2q$kT2$4#R;$$Ix016h<MBDqx7F%$`RmDLThvo>9%uf#aM`us"
+    "rsdpUc7?ZRa&G0NwsDcpX6(+V=N6S?wXvGpY8KXPEjNFT*4~xe?Ch;^9XFQKHLc?IMZ=Y?eL2G$Ysal-"
+    "Va-;K^XF*oT{q6o-WpepV>w;ZnsHwgW8aF(PoAww=g-mFyCR*Py)~{!$8x%+)#$!x(XO?c_q=yyJ3D)8"
+    "T-T1}bWN+;ebKaQJT!Oq^tc`#%jud{!~3Fz6B=aZTu<xfeNoNhx!If5)Y~!AytDO98$TOq7TbEw(?-6b"
+    ")~ldq`Hq^YirSlBDL<1gs$OdIt$j65vwM`J9nee_)ZY7?&}L{<6*b-?HDg&6RWG&KR#X+#-h0!~8fsJ("
+    "HQv`YV>1<1FSWVWYE{%YDl}u=^@k5Oe~r|3<5gCBt@KTot!!m0TiMDsNSlmk^3hB#l8K|3FoJ0%5wqmt"
+    "l{i)j<CMnLBa=8P2_uruuEii>{LxJmarC%)UHJ$a7d^v~GZ;0qemzcxecR~E{&7tKN6q_e(xR_}Y4yx!"
+    "907vSA7g6q9_ZOzjkM40_4ryoER2V^o+2O~)Gum`Fj&G`;Xf+*OWDd+wz8EiM+++{$T|wXih`@5z!em*"
+    "e!}WO9v+{A$K~JQ+&h?eXMd4t$7MI+ye62@WKw<n6_2^XaaL1nBcgB=)N~rL^p1j{o`4@i?8XoC*kK$u"
+    "yoHD%b8%xFD~9o5hu8hg>|I8m@}!#Y7d^f=lXv!Em=1p2svEP)<5h92>SFa+BaSb^n4<M-o=EgR?n1u8"
+    "1NHIsjQ2e5631NLQj2%N7?-EW6ZVGwSo26k9EG?X>E`R0Eh%UGq2>g06(M?hR2sJA$TV!>=rn9{gc>$K"
+    "N)6isxiiQlN2Xy5N2ig_BSxr^f}><^mzlZu7LHECCP%1Y^P|+TeVlvCa)cT-KS~YTh}@oOKS~YTe7V<K"
+    "sKb%W$(TZHVO$|L8C!_W#}{Ion){f;NJDHg+7O$MIK=i;?k&scL%Op-W`CKPdpkZJ5!>6j*L%Oizgrml"
+    "hfT)+Ve>J7*pA5Uo0su`*nCVNwo`I%$43Zao0xmO3pyNuE~ECa`N%!87IWK7K8}yDGxvI<J8YFnFJv=*"
+    "$Z;J$&dIZ}wVIA$$Civ^#}>x2W0Udh*nCVow&Qa5Q^`1XY+)=rHW|;3&BwH3yCV1A+J`wsAxx`?@^*)j"
+    "AsNSxEsSNyCga($`IvTWo8|6<!&r7~GM*iqk7=h~B=?q!!n0QKYhs6SD2!#tCga(OPuFAGvCYVRd@`P$"
+    "*t3>-(caCyomP=?REK-=FnTDAA8ICoNJauR6AQFkhtF3=zBCj2a$bjz^VU*-E?e2kR<^R0ZIHLcgco3$"
+    "x*uSLnkV2(<O^6$t*+J-x%XY>ea^d&S@#dDXVvGN`j}Dwl3Lb$RI8^^Zu}S2`)c*NqQ7oU)8Cj>{mo$u"
+    "*s7lMo^52bijS=2v`3ru63SeE8$1fG#ynS;$NKV1)^gFKjkFPEoZnp^QmgZhRo-u>{PEA~w=~vcU%{+z"
+    "CX_s;Y-OA6TT!`@lG|-HS5ml@{F#&FTG?5Y{Bp5;O71(ESBd9vb|umRB5GKxIflZm<j*)H*UHX5B(6&&"
+    "50U#$<|C>pH<Xo#u0`s6^XK!CYh~y5@yo@s{J8IAwjZ9uIe%~}nfE6<w~k*fmSx9%C$sJF9L~9eQ(@kn"
+    "SPmTboy>*9b2uXoPRXn|GKUS%;Y>C-<+IsvUK*ToxoPh2Gn$9Jz#Ks@Fh=wOi`ILArE9&w^3)5gYI}jN"
+    "sjsWn_AdL1%|&0aeZ8;Psn%EQNqxn5+gI$T4rqFBvO0~gOXDiia4j0FLUVBwTlP73U7lTzV!)_{dva~Z"
+    "Wz6L)xfp-&e1r8k>n&!weXrLgF@LRz^i*>esO8H(Z`mLZzR!X0^51jrd(3;kWz$FCd&Qka{v?+(iG57y"
+    "Q#zuFE&B`&E-wRTV?b}w#kscQGAwXj1&lwqwZVFvCjqk~{JqyDG3UYak#GN1$nPd=5Bt3JE@wUGtH)gR"
+    "OElp*@KuLhej?6Eg#Mcib8W}vJm5?RnBQQx2J3O=0?b!%aIZ^Z7J{EezCFE<UJ+ld*X5n(ob#A({<d7("
+    "c6E9=FA(MedZxj8oL>O53cT6tl9(&t)5y2oEu(|0g3DRtF@yZ_4YtLjq;XvIdc7`*<CwROeEZ!Nj+5)p"
+    "Vt)9;dtDpH-<}lt_N=D%hjn3p7g^(vIk)maX>ku2tq0kQ*L#q|IL!x{4C_9~XHffD!?Kz+)mmz8wT@a>"
+    "trt{b+*8zH9AB@*xL>Un;{jBS@nCg`I#eAdDleW>uf2F-t@`4{RDbbOb(y+cU7>u`ql<Oq2uF--d_cK~"
+    "M2<tm=);+cBL^{F@MDG1ej{MMG7D^?tsYe4Sy$BK*|=VjXY*Q3o~@`V&$h4~Y!5Py#YeBWm=%sx!T6Np"
+    "z(<?77!!^x!FZA@z(t2}ObAATOa+eXz-W%A0An*|!rMdmcN;Bg;w)INinC~~F3yrv8D}ZIv|dL0_zxHL"
+    "!Lc3~;jx)^@fsYZfw39mG)G!se8mwOqa{w!69-Wi*c<EhYHqGotht?P*4(A1>btdzs^C}(jG&mIIUWL|"
+    "Al}s&)1b|$e#e(D)auKuKow?IHmjIb4aYHH^ui_vV-a>V?Tsv$Kow$+GDn+Z48|0kZu%M_aGkl{++gzh"
+    "{U0e&zHDVHTiM#sl2xw4`c`rbQ8tGTD^<xFRelUmjAzT5Q@+}i8_6SCxUV7Qsz>pt9A@XPG8ET@!f`h9"
+    "0aty(dQS@h)^%D07KJdAr_AE%$GpUNrOe9dGjh6-E0T5kJew}ZCXYg4HtO<ca_&qVSMoM+c1+BS`95F<"
+    "%n#uskl7@CCP_EGLvk~pAJXN9<gpse*<9X7&iRO=FD7cv>WCQ~FVL8|agv^_eQrdT7m-ImFcWe)4>{i<"
+    "j%gTWIHMtEGaPL&YvEWkzj2w)IKvr^DcH?$mNLvvHqKzKvGHbK!x^wJ^VMX7d90?GOATgWnr7}bWv!R8"
+    "m2GxwhpP!eRiES3@nRe>`jk$oj|N81Qhx1cc0;&iw(Kxdw#<^9t*#6fqzrRB%lythw{uM2=rqF0tj0d0"
+    "vCC#G)rVrR*k?F(nN2yPDQgCKk=o_J<lL8-^YXkXdUGa5%)mIcj^vnU@EMEe&1B?DM$gQVh@Tk~M9?f6"
+    "=+9nzcDgfb&Zsx9ozwpuM%ip0#Mx{wB5igOinUX#S*b>q`rsUU3wt}+)A?S`^>Ey~Vb6AHgDuOR&i8Vz"
+    "hvVK2d$zx1Y{&O<u7~5^4STkidRfo)aNN6L&-OuNN$%aSXX{R=ve>iDBj(NDq-q;R3oV<dAulV)d&SzR"
+    ")vQ#bO1({vy~>E9orCH_zUGiqw^`XnRr}}$Tb4bx@2y==&Al}C(3fUx$M@E*r{-Q7d+0lQS<m&<+)HB*"
+    "{di<a?xnGZekt)S_R#+p^WJIVcat$sI;i^YYrZ>mo0V-;wLjNDh4wK~D~kF)uBs1f;HZCZlCd3+Ck{&("
+    "M-W5y>}5TNC5$78A%{hlWE?>ZIWh4qV#t|d-nlu|b{~^<rKsEPs<yKRj{5hV8QXL5S`XAK>u^0C)X4wY"
+    "%X$vW7{?I9{u5b}ag6fpC%#1t8zGQk?i?uLBElA}*J0->?5L5i)XVxV&p786$9&=&MwVoxM3mev@hzg{"
+    "&SKu44UUr|&i1d>SjP(MM@H7*9M+h(`WK0B5p91Z=3SVvKa5-ZHC0l-Hn9|DTmG|{cSkQ<x!*is9u(g_"
+    "7Fq7O(jvEQY>?{+xkpj{?;S)wBxDw?`omkbkn-C=*_KYsrjZs5+bjzW8Gr05BCixOi&p*NVZFlq-tqjl"
+    "T(-p)v(2O>#<th{gWz`?S<k(N+#$brT-N=|_LOJalrig3+KOx)UeND;^lNMR#gHLnd&+%ny_nBDX1z*V"
+    "m95iG<g!_ca-ks?i22N2B@yX6m)0=bzs2RUIm8@F$S-~8T$h49=xj%~lFR05bB)D%_Ml_kgj-GHN(T>_"
+    "hs`4<Rw3YdlZ|jVH;HmMFGM<=Bhd~&d&I*}4)t)Fkq@U3{qTJ~VJRlD5a)$>h;t++;%ASG_{m`-PBT8z"
+    "Z(=bL-wzXe3lWppmq1No;dSK1PYykCnh_MI5JicNi7h9y?}d5yWX3(8YtLobllk?+40<wmp3j=+^5w})"
+    "c`_HC&w}Uj-^t8(KDV9AYA5sAxr}u(`YndwNi4*9As*r!iHZ2x<05`?*of1Nk2r-GiSOHsy{0StCUYZ&"
+    "S&?KuB%cY%<v^0zkBX`y*lIn%{Pq2^tM<hz^2HE5L`<9`Q4>FV<it-7J#m^5lzLx_qSP-4WJ}i44KonQ"
+    "+(SO=kjpnDGYz#`p)Y^Mz3e)Au^M?X1ecgf7FZou@sq<=oMwEbe!yZZzTYjj7gn>C`G0)oAD8n-X8Xxs"
+    "7caZoU96H_48c9(lIl`JUBUuFUYtVo#rIXk`m(B*&&lJm@yI+p*;VRd73g9J?ywlA8IN%aF`4=Rv4*c4"
+    "<#Ol9tU0ktaxnyFgvKdEX?(vyEahq)$>_Hjf+J?*yNrHojNoBYWh+}T4cgH9>zLZHqgFSQW8v60{zG|d"
+    "maXi3$_Kp!6oB$x?&l-#ufu4^)>~aW$5LgFUbbSMyF80#Es=fa2Or%O<UPc;@3;7EwzgiwMbh)iE}(3)"
+    "FYV|jZJ<p|pqE9;N4#u9tiLD`eQ+WAAYhI|_g-%IX$*ja?9hG-*=7^#mB>9b1gpWVa}6L-to_1S-$k|Z"
+    "NiJI(?`w}j;;n`%^a_xw;W8QD#b$;d>r*L&?3ewvVVf<k*Lac0yz&+=TVHI4#`L@qLZ)Xn<M{2D{T9B>"
+    "mey;uNcn7+ZBX|+C8Bo*(felWwXj<5g&QrC(die`7Y@~P8}J9&ANwtOo2{$|gSD?7;3ncw2Cep-$N)RY"
+    "j_tRgZ8o*uP-p5x*}c{mupJcVHsE}KZQO5Pw+XZLL)_n5Q2##6gX!D`+(C9`zeQ{lI{Oplqm?bP(WaPR"
+    "9zvGIq@v`gwaYqm&utJKWdH29_-(ef-fSSM4`myDu$sRE(^l@FJzbcsJ-a^DW$SG3spNZ|d-A_zSJQBr"
+    "jPGJIRU?N`f9|&p+iY>Y#*6fi{oIP#ncu`~XnFN&GPUW-4AFBN=m*&k`z?5z{i2zKmoAtPr&#;n+ZAtq"
+    "wPqI1u}sEyv6;=>O+)nD2E#%2(|+5q%@)@ynPa;dTn7#C!GCT8@gO_4--5OY{rfOBsk-OUkXjd38;ha6"
+    "Yn#Pg%^`bk1OFiVWxs`Qb3nj!Q)t^FNHqlrdHU(B4z|DxJao@(5FBLx?6>%BLcc!M!fI1;Lf99*yH#6U"
+    "t(k>$ER*qFAD`=?dTxW^Ap2>*ZP=zNTiFJ@o&rj~DfbT_2_Ib5`**RK;m7)vg8UCfr}tavHk)5Bdy(Wk"
+    "7+m*Ip5HX<XNX?Z#AWlBsei7|P&u~&c#xgiZ!z0!X1$Uj42XWInTI&XbCPk}#%{Fmu4#N*41$B~pZylU"
+    "&DPdyxJdcfm#u%g!!kK!OWQ1yLzZp8Ki%bc^geB~9FJbMetl5$JU>}Ce)L{${*En2ua);%C+@ROU4|iW"
+    "ZUgTiJG9>tW@lehb?A5$2Jk_4c)vw%v+4CR7b$z1vJHL1qkPcI2fe(P`#Y`1Ksw0w@3+s}ET7mR_@L%^"
+    "Br@*P*zMK+`(?l$WJmW~+&0Sxd(c1I`NoUnSSI7U*i2~C(>*W`vcvl=a+_^`#{VCx>qEr"
+)
+# <<< generated by build_tables.py
+
+
+class StaticTables(NamedTuple):
+    """The bot only reads rows through transition_row and brew_row; spells and
+    recipes (with repeatable flags and base prices) are only there to index
+    the rows and to validate the tables against build_tables.py"""
+
+    data: bytes
+    inventories: List[Tuple[int, ...]]
+    spells: List[Tuple[Tuple[int, ...], bool]]
+    recipes: List[Tuple[Tuple[int, ...], int]]
+    spell_rows: Dict[Tuple[int, ...], int]  # delta -> offset of its row in data
+    recipe_rows: Dict[Tuple[int, ...], int]
+
+
+def decode_tables(blob: str) -> StaticTables:
+    "Unpack TABLES_BLOB, see build_tables.py for the layout"
+    data = zlib.decompress(base64.b85decode(blob))
+    n_inventories, n_spells, n_recipes = struct.unpack_from("<HHH", data)
+    offset = 6
+    inventories: List[Tuple[int, ...]] = [
+        tuple(data[i : i + 4]) for i in range(offset, offset + 4 * n_inventories, 4)
+    ]
+    offset += 4 * n_inventories
+    spells: List[Tuple[Tuple[int, ...], bool]] = [
+        (tuple(row[:4]), bool(row[4]))
+        for row in struct.iter_unpack("<4bB", data[offset : offset + 5 * n_spells])
+    ]
+    offset += 5 * n_spells
+    recipes: List[Tuple[Tuple[int, ...], int]] = [
+        (tuple(row[:4]), int(row[4]))
+        for row in struct.iter_unpack("<4bB", data[offset : offset + 5 * n_recipes])
+    ]
+    offset += 5 * n_recipes
+    spell_rows: Dict[Tuple[int, ...], int] = {}
+    for delta, _ in spells:
+        spell_rows[delta] = offset
+        offset += 2 * n_inventories
+    recipe_rows: Dict[Tuple[int, ...], int] = {}
+    for delta, _ in recipes:
+        recipe_rows[delta] = offset
+        offset += n_inventories
+    return StaticTables(data, inventories, spells, recipes, spell_rows, recipe_rows)
+
+
+TABLES = decode_tables(TABLES_BLOB)
+
+# every inventory with at most 10 ingredients gets a dense index (1001 of them),
+# so a search node fits into a single int: (spell bits << 10) | inventory index
+INVENTORIES: List[Tuple[int, ...]] = TABLES.inventories
+INVENTORY_INDEX: Dict[Tuple[int, ...], int] = {
+    inv: i for i, inv in enumerate(INVENTORIES)
+}
+INVENTORY_BITS = 10
+INVENTORY_MASK = (1 << INVENTORY_BITS) - 1
+
+# rows are only unpacked from TABLES (or computed, for unknown deltas) on first use
+_transition_rows: Dict[Tuple[int, ...], array] = {}
+_brew_rows: Dict[Tuple[int, ...], bytes] = {}
+
+
+def transition_row(delta: Tuple[int, ...]) -> array:
+    "Inventory index after applying delta to each inventory, -1 if impossible"
+    row = _transition_rows.get(delta)
+    if row is None:
+        row = array("h")
+        offset = TABLES.spell_rows.get(delta)
+        if offset is not None:
+            row.frombytes(TABLES.data[offset : offset + 2 * len(INVENTORIES)])
+            if sys.byteorder == "big":
+                row.byteswap()
+        else:
+            row.extend(
+                INVENTORY_INDEX.get(add_inventories(inv, delta), -1)
+                for inv in INVENTORIES
+            )
+        _transition_rows[delta] = row
+    return row
+
+
+def brew_row(delta: Tuple[int, ...]) -> bytes:
+    "1 for each inventory index that has enough ingredients for the brew"
+    row = _brew_rows.get(delta)
+    if row is None:
+        offset = TABLES.recipe_rows.get(delta)
+        if offset is not None:
+            row = TABLES.data[offset : offset + len(INVENTORIES)]
+        else:
+            row = bytes(
+                all(i >= -d for i, d in zip(inv, delta)) for inv in INVENTORIES
+            )
+        _brew_rows[delta] = row
+    return row
+
+
 ######################
 # Breadth First Search
 ######################
@@ -251,6 +605,393 @@ def bfs_fastest_brew(
         return BfsFailure(f"T/O {len(prev)}M")
 
 
+# Buffers for _bfs_search, allocated once and reused every turn.
+# Node i of the search lives in _bfs_states[i], its parent node index in
+# _bfs_parents[i] and the action that produced it in _bfs_codes[i]:
+# -1 is REST, -2-j is LEARN of learns[j], spell*16+num is CAST spell num times.
+BFS_CAPACITY = 1 << 18
+_bfs_states = array("q", bytes(8 * BFS_CAPACITY))
+_bfs_parents = array("i", bytes(4 * BFS_CAPACITY))
+_bfs_codes = array("i", bytes(4 * BFS_CAPACITY))
+# a set, cleared each search: slots probed from Python were 2x slower
+_bfs_seen: set = set()
+
+
+def bfs_decode_path(
+    node: int, spells: List[Cast], learns: List[Learn]
+) -> List[BfsActions]:
+    result: List[BfsActions] = []
+    while _bfs_parents[node] >= 0:
+        code = _bfs_codes[node]
+        if code == -1:
+            result.append(Rest())
+        elif code < -1:
+            result.append(learns[-2 - code])
+        else:
+            result.append(BfsCast(spells[code >> 4], code & 15))
+        node = _bfs_parents[node]
+    return result[::-1]
+
+
+# @profile
+def _bfs_search(
+    start_witch: Witch,
+    learns: List[Learn],
+    requirements: List[Tuple[int, ...]],
+    deadline: float,
+    expand_root: bool = True,
+) -> Tuple[List[List[int]], int, bool, List[Cast]]:
+    """Breadth first search over the preallocated buffers: nodes are plain ints,
+    no tuples, NamedTuples or frozensets are created inside the loop.
+    Every learn is a branch of the root, hits[0] is the branch without learning
+    and hits[j + 1] the branch that learned learns[j]. For every branch and
+    requirement returns the first (nearest) node that satisfies it or -1,
+    then the number of nodes, whether the search finished (all requirements
+    met or everything explored) and the spells the CAST codes refer to.
+    With expand_root=False only the learn branches are searched."""
+    casts = sorted(start_witch.casts)
+    spells = casts + [Cast(77777, l.delta, True, l.repeatable) for l in learns]
+    rows = [transition_row(s.delta) for s in spells]
+    repeatable = [s.repeatable for s in spells]
+    n = len(casts)
+    cast_bits = (1 << n) - 1
+    learned_bits = cast_bits | (1 << n)
+    learned_shift = n + 1
+
+    # bit r of final[i] is set when inventory i satisfies requirements[r]
+    final = array("q", bytes(8 * len(INVENTORIES)))
+    for r, delta in enumerate(requirements):
+        can_brew = brew_row(delta)
+        for i in range(len(INVENTORIES)):
+            if can_brew[i]:
+                final[i] |= 1 << r
+    hits = [[-1] * len(requirements) for _ in range(len(learns) + 1)]
+    all_bits = (1 << len(requirements)) - 1
+    pendings = [all_bits if expand_root else 0] + [
+        all_bits if start_witch.can_learn(learn) else 0 for learn in learns
+    ]
+    pending_branches = len(pendings) - pendings.count(0)
+
+    states, parents, codes, seen = _bfs_states, _bfs_parents, _bfs_codes, _bfs_seen
+    seen.clear()
+    start_mask = 0
+    for i, c in enumerate(casts):
+        if c.castable:
+            start_mask |= 1 << i
+    start_inv = INVENTORY_INDEX[start_witch.inventory]
+    states[0] = (start_mask << INVENTORY_BITS) | start_inv
+    parents[0] = -1
+    codes[0] = 0
+    seen.add(states[0])
+    head = 0
+    tail = 1
+    # stop before a node could overflow the buffers with its children
+    limit = BFS_CAPACITY - 11 * len(spells) - len(learns) - 1
+
+    complete = True
+    while head < tail and pending_branches:
+        if not head & 63 and time.time() >= deadline or tail > limit:
+            complete = False
+            break
+        state = states[head]
+        inv = state & INVENTORY_MASK
+        bits = state >> INVENTORY_BITS
+        learned = bits >> learned_shift
+
+        found = final[inv] & pendings[learned]
+        if found:
+            pendings[learned] ^= found
+            for r in range(len(requirements)):
+                if found >> r & 1:
+                    hits[learned][r] = head
+            if not pendings[learned]:
+                pending_branches -= 1
+                if not pending_branches:
+                    break
+
+        if head == 0:
+            for j in range(len(learns)):
+                learn = learns[j]
+                if start_witch.can_learn(learn):
+                    learn_inv = INVENTORY_INDEX[start_witch.learn(learn).inventory]
+                    new_state = (
+                        (((j + 1) << learned_shift) | bits | (1 << n))
+                        << INVENTORY_BITS
+                    ) | learn_inv
+                    if new_state not in seen:
+                        seen.add(new_state)
+                        states[tail] = new_state
+                        parents[tail] = head
+                        codes[tail] = -2 - j
+                        tail += 1
+            if not expand_root:
+                head += 1
+                continue
+
+        for s in range(n + 1 if learned else n):
+            bit = 1 << s
+            if not bits & bit:
+                continue
+            spell = s if s < n else n + learned - 1
+            row = rows[spell]
+            new_inv = row[inv]
+            if new_inv < 0:
+                continue
+            base = (bits ^ bit) << INVENTORY_BITS
+            num = 1
+            while True:
+                new_state = base | new_inv
+                if new_state not in seen:
+                    seen.add(new_state)
+                    states[tail] = new_state
+                    parents[tail] = head
+                    codes[tail] = (spell << 4) | num
+                    tail += 1
+                # multicast
+                if not repeatable[spell]:
+                    break
+                new_inv = row[new_inv]
+                if new_inv < 0:
+                    break
+                num += 1
+
+        new_state = (
+            (bits | (learned_bits if learned else cast_bits)) << INVENTORY_BITS
+        ) | inv
+        if new_state not in seen:
+            seen.add(new_state)
+            states[tail] = new_state
+            parents[tail] = head
+            codes[tail] = -1
+            tail += 1
+        head += 1
+
+    return hits, tail, complete, spells
+
+
+class BrewDistance(NamedTuple):
+    distance: int
+    first: Optional[BfsActions]
+
+
+# requirement -> distance and first action, None if it can't be reached at all
+BrewDistances = Dict[Tuple[int, ...], Optional[BrewDistance]]
+
+
+##############
+# Search Cache
+##############
+
+
+def spellbook_signature(casts: FrozenSet[Cast]) -> Tuple[Tuple, ...]:
+    return tuple(sorted((c.action_id, c.delta, c.repeatable) for c in casts))
+
+
+def castable_mask(casts: FrozenSet[Cast]) -> int:
+    mask = 0
+    for i, c in enumerate(sorted(casts)):
+        if c.castable:
+            mask |= 1 << i
+    return mask
+
+
+class SearchCache:
+    """LRU memo of search results.
+    Key is (spellbook signature, inventory, castable mask), value maps each brew
+    requirement searched so far to its distance and first action. Every position
+    on a found path is stored, so next turn's position is usually already known.
+    Everything is dropped when the real spellbook changes (we learned something)."""
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[Tuple, BrewDistances]" = OrderedDict()
+        self.spellbook: Optional[Tuple[Tuple, ...]] = None
+        self.hits = 0
+        self.misses = 0
+        self.size = 0  # bytes of keys, entries and distances, kept up to date
+
+    def set_spellbook(self, casts: FrozenSet[Cast]) -> None:
+        signature = spellbook_signature(casts)
+        if signature != self.spellbook:
+            self.entries.clear()
+            self.size = 0
+            self.spellbook = signature
+
+    def entry(self, witch: Witch) -> BrewDistances:
+        key = (
+            spellbook_signature(witch.casts),
+            witch.inventory,
+            castable_mask(witch.casts),
+        )
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = {}
+            self.entries[key] = entry
+            self.size += sys.getsizeof(key) + sys.getsizeof(entry)
+            if len(self.entries) > self.max_entries:
+                old_key, old_entry = self.entries.popitem(last=False)
+                self.size -= sys.getsizeof(old_key) + sys.getsizeof({})
+                for distance in old_entry.values():
+                    self.size -= sys.getsizeof(distance)
+        else:
+            self.entries.move_to_end(key)
+        return entry
+
+    def store(
+        self,
+        entry: BrewDistances,
+        requirement: Tuple[int, ...],
+        distance: Optional[BrewDistance],
+    ) -> None:
+        "Keep what is already known, shortest paths don't get any shorter"
+        if requirement not in entry:
+            entry[requirement] = distance
+            self.size += sys.getsizeof(distance)
+
+    def store_path(
+        self,
+        entry: BrewDistances,
+        witch: Witch,
+        requirement: Tuple[int, ...],
+        path: List[BfsActions],
+        unreachable: List[Tuple[int, ...]],
+    ) -> None:
+        """Store the path from witch, whose entry is given. The node k steps
+        along a shortest path is len(path) - k away, and what is unreachable
+        from the start is unreachable from there too"""
+        for k, action in enumerate(path + [None]):
+            if k:
+                entry = self.entry(witch)
+            self.store(entry, requirement, BrewDistance(len(path) - k, action))
+            for delta in unreachable:
+                self.store(entry, delta, None)
+            if isinstance(action, BfsCast):
+                for _ in range(action.num):
+                    witch = witch.cast(action.cast)
+            elif isinstance(action, Rest):
+                witch = witch.rest()
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def memory_size(self) -> int:
+        "Approximate bytes held by the entries (keys are shared with spellbooks)"
+        return sys.getsizeof(self.entries) + self.size
+
+    def __str__(self) -> str:
+        return (
+            f"cache {len(self.entries)}/{self.max_entries} "
+            f"hit {self.hit_rate()*100:.0f}% {self.memory_size() // 1024}KB"
+        )
+
+
+def entry_decides(entry: BrewDistances, brews: List[Brew]) -> bool:
+    "Whether the entry knows enough to pick the most expensive reachable brew"
+    price = None
+    for brew in sorted(brews, key=lambda b: b.price, reverse=True):
+        if price is not None and brew.price < price:
+            return True
+        if brew.delta not in entry:
+            return False
+        if entry[brew.delta] is not None:
+            price = brew.price
+    return True
+
+
+class BfsPlan(NamedTuple):
+    first: BfsActions
+    distance: int
+    brew: Brew
+    score: float
+
+
+def cached_fastest_brew(
+    cache: SearchCache,
+    start_witch: Witch,
+    brews: List[Brew],
+    learns: List[Learn],
+    deadline: float,
+) -> Union[BfsPlan, BfsFailure]:
+    """Most expensive reachable brew (nearest on ties). The current position and
+    the position right after each affordable learn are looked up in the cache;
+    the ones missing are searched together by one _bfs_search, a branch each."""
+    requirements = list(dict.fromkeys(b.delta for b in brews))
+    learns = [l for l in learns if start_witch.can_learn(l)]
+    witches = [start_witch] + [start_witch.learn(l) for l in learns]
+    entries = [cache.entry(w) for w in witches]
+    missing = [not entry_decides(e, brews) for e in entries]
+    cache.hits += missing.count(False)
+    cache.misses += missing.count(True)
+
+    nodes = 0
+    if any(missing):
+        search_learns = [l for l, m in zip(learns, missing[1:]) if m]
+        # branch 0 is the current position, branch j + 1 is search_learns[j]
+        branches = [0] + [i for i, m in enumerate(missing) if i and m]
+        hits, nodes, complete, spells = _bfs_search(
+            start_witch, search_learns, requirements, deadline, missing[0]
+        )
+        for branch, i in enumerate(branches):
+            if not missing[i]:
+                continue
+            unreachable = [
+                r for r, node in zip(requirements, hits[branch]) if node < 0
+            ]
+            if not complete:
+                unreachable = []
+            for r, node in enumerate(hits[branch]):
+                if node >= 0:
+                    path = bfs_decode_path(node, spells, search_learns)
+                    if branch:
+                        # only the position right after learning: the ones past
+                        # it never come up again (a real LEARN clears the cache)
+                        path = path[1:]
+                        cache.store(
+                            entries[i],
+                            requirements[r],
+                            BrewDistance(len(path), path[0] if path else None),
+                        )
+                    else:
+                        cache.store_path(
+                            entries[i], witches[i], requirements[r], path, unreachable
+                        )
+                elif complete:
+                    cache.store(entries[i], requirements[r], None)
+
+    best: Optional[BfsPlan] = None
+    timed_out = False
+    # learns go first so they win ties, like in a single BFS where the learn
+    # branches are queued before the casts
+    options: List[Optional[Learn]] = [*learns, None]
+    for entry, learn in zip(entries[1:] + entries[:1], options):
+        for brew in brews:
+            if brew.delta not in entry:
+                timed_out = True
+                continue
+            found = entry[brew.delta]
+            if found is None:
+                continue
+            if learn is not None:
+                first: Optional[BfsActions] = learn
+                distance = found.distance + 1
+            else:
+                first = found.first
+                distance = found.distance
+            if first is None:
+                continue
+            if (
+                best is None
+                or brew.price > best.brew.price
+                or brew.price == best.brew.price
+                and distance < best.distance
+            ):
+                best = BfsPlan(first, distance, brew, float(brew.price))
+    if best is None:
+        return BfsFailure(f"{'T/O' if timed_out else 'no path'} {nodes}M")
+    return best
+
+
 #################
 # Game Input Read
 #################
@@ -261,9 +1002,12 @@ class GameInput:
         self.brews: List[Brew] = []
         self.learns: List[Learn] = []
         self.my_witch: Witch
+        self.start_time = 0.0
 
     def read(self):
         action_count = int(input())
+        # the turn starts when its first line arrives, parsing counts too
+        self.start_time = time.time()
         casts: List[Cast] = []
         for i in range(action_count):
             # action_id: the unique ID of this spell or recipe
@@ -382,19 +1126,65 @@ def learn_profit(learn: Learn, w: Witch, turn) -> Tuple[float, int]:
     return result * learn_diminishing_coefficient, result
 
 
+#########
+# Latency
+#########
+
+
+class TurnLatency:
+    """Time from the first input line to printing the action, worst case
+    included, plus the worst work done after printing (it can eat into the
+    next turn, whose input may already be waiting)"""
+
+    def __init__(self) -> None:
+        self.turns = 0
+        self.total = 0.0
+        self.worst = 0.0
+        self.worst_turn = 0
+        self.worst_after = 0.0
+
+    def record(self, turn: int, seconds: float) -> None:
+        self.turns += 1
+        self.total += seconds
+        if seconds > self.worst:
+            self.worst = seconds
+            self.worst_turn = turn
+
+    def record_after(self, seconds: float) -> None:
+        self.worst_after = max(self.worst_after, seconds)
+
+    def mean(self) -> float:
+        return self.total / self.turns if self.turns else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"mean {self.mean()*1000:.1f}ms "
+            f"worst {self.worst*1000:.1f}ms (turn {self.worst_turn}) "
+            f"after {self.worst_after*1000:.1f}ms"
+        )
+
+
 ###########
 # Main loop
 ###########
 
 
 def main() -> None:
+    log(f"startup {(time.perf_counter() - STARTUP_START)*1000:.1f}ms")
+    latency = TurnLatency()
+    cache = SearchCache()
+    # collector never runs inside the turn window, only after the action is out
+    gc.collect()
+    gc.freeze()
+    gc.disable()
     turn = 0
     while True:
         turn += 1
 
         game = GameInput()
         game.read()
-        start_time = time.time()
+        start_time = game.start_time
+        cache.set_spellbook(game.my_witch.casts)
 
         profit_worth_to_learn = 5
         profit_worth_to_make_blues_and_learn = 6
@@ -451,20 +1241,20 @@ def main() -> None:
             #         game.learns,
             #     )
             # )
-            result = bfs_fastest_brew(
+            result = cached_fastest_brew(
+                cache,
                 game.my_witch,
                 brews=game.brews,
                 learns=game.learns,
                 deadline=start_time + 0.040,
             )
-            if isinstance(result, BfsSuccess):
-                best_path, best_brew, best_score = bfs_best_path(result)
-                first = best_path[0]
+            if isinstance(result, BfsPlan):
+                first, distance, best_brew, best_score = result
 
                 delta_time = time.time() - start_time
                 delta_time_str = f"{delta_time*1000:.0f}ms"
                 countdown_text = (
-                    f"T-{len(best_path)} {delta_time_str} "
+                    f"T-{distance} {delta_time_str} "
                     f"score={best_score:.1f} 💎{best_brew.price}"
                 )
 
@@ -500,6 +1290,14 @@ def main() -> None:
                 else:
                     Rest().rest(result.message + " -> can't cast -> rest")
 
+        sys.stdout.flush()
+        latency.record(turn, time.time() - start_time)
+        after_start = time.time()
+        log(f"turn {turn}: {latency} {cache}")
+        # young generations only: a full collection walks the whole cache (~8ms)
+        gc.collect(1)
+        latency.record_after(time.time() - after_start)
+
 
 if __name__ == "__main__":
     main()
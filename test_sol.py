@@ -1,4 +1,25 @@
-from sol import BfsSuccess, Cast, bfs_fastest_brew, Witch, Brew, Learn, bfs_best_path
+from sol import (
+    BfsCast,
+    BfsPlan,
+    BfsSuccess,
+    Cast,
+    bfs_fastest_brew,
+    Witch,
+    Brew,
+    Learn,
+    bfs_best_path,
+    TurnLatency,
+    SearchCache,
+    cached_fastest_brew,
+    TABLES,
+    INVENTORIES,
+    INVENTORY_INDEX,
+    add_inventories,
+    transition_row,
+    brew_row,
+)
+import build_tables
+import sys
 import time
 
 
@@ -193,6 +214,181 @@ def test_bfs_timeout():
     # assert len(result) == 5
 
 
+def test_cached_fastest_brew():
+    witch = Witch(
+        (3, 0, 0, 0),
+        frozenset(
+            [
+                Cast(777, (2, 0, 0, 0), castable=True, repeatable=False),
+                Cast(888, (-1, 1, 0, 0), castable=True, repeatable=False),
+                Cast(999, (0, -1, 1, 0), castable=True, repeatable=False),
+                Cast(666, (0, 0, -1, 1), castable=True, repeatable=False),
+            ]
+        ),
+    )
+    brews = [Brew(action_id=111, delta=(0, 0, 0, -4), price=100500)]
+    result = cached_fastest_brew(
+        SearchCache(), witch, brews, learns=[], deadline=time.time() + 99999999999
+    )
+    assert isinstance(result, BfsPlan)
+    assert result.distance == 16
+    assert result.brew == brews[0]
+
+
+def test_cached_fastest_brew_repeat():
+    witch = Witch(
+        (3, 0, 0, 0),
+        frozenset(
+            [
+                Cast(777, (2, 0, 0, 0), castable=True, repeatable=False),
+                Cast(555, (-2, 2, 0, 0), castable=False, repeatable=True),
+            ]
+        ),
+    )
+    brews = [Brew(action_id=111, delta=(0, -4, 0, 0), price=10)]
+    expected = bfs_best_path(
+        bfs_fastest_brew(witch, brews, [], deadline=time.time() + 99999999999)
+    )[0]
+    result = cached_fastest_brew(
+        SearchCache(), witch, brews, [], deadline=time.time() + 99999999999
+    )
+    assert isinstance(result, BfsPlan)
+    assert result.distance == len(expected) == 3
+    assert isinstance(result.first, BfsCast) and isinstance(expected[0], BfsCast)
+    assert result.first.cast.action_id == expected[0].cast.action_id
+
+
+def test_turn_latency():
+    latency = TurnLatency()
+    latency.record(1, 0.010)
+    latency.record(2, 0.030)
+    latency.record(3, 0.020)
+    assert latency.worst == 0.030
+    assert latency.worst_turn == 2
+    assert abs(latency.mean() - 0.020) < 1e-9
+    latency.record_after(0.002)
+    latency.record_after(0.001)
+    assert latency.worst_after == 0.002
+
+
+def test_search_cache():
+    casts = frozenset(
+        [
+            Cast(777, (2, 0, 0, 0), castable=True, repeatable=False),
+            Cast(888, (-1, 1, 0, 0), castable=True, repeatable=False),
+        ]
+    )
+    witch = Witch((0, 0, 0, 0), casts)
+    cache = SearchCache()
+    cache.set_spellbook(casts)
+    brews = [Brew(1, (0, -2, 0, 0), 10), Brew(2, (0, 0, -1, 0), 20)]
+    result = cached_fastest_brew(cache, witch, brews, [], 1e18)
+    assert isinstance(result, BfsPlan)
+    assert result.distance == 4
+    assert result.first.cast.action_id == 777
+    assert cache.entry(witch)[(0, 0, -1, 0)] is None  # nothing makes tier-2
+    cached_fastest_brew(cache, witch, brews, [], 1e18)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.memory_size() > 0
+
+    # least recently used entry goes first
+    cache = SearchCache(max_entries=2)
+    entry = cache.entry(witch)
+    cache.entry(Witch((1, 0, 0, 0), casts))
+    cache.entry(witch)
+    cache.entry(Witch((2, 0, 0, 0), casts))
+    assert len(cache.entries) == 2
+    assert cache.entry(witch) is entry
+
+    # the running size matches a walk over everything, evicted entries included
+    cache = SearchCache(max_entries=3)
+    cached_fastest_brew(cache, witch, brews, [], 1e18)
+    assert len(cache.entries) == 3
+    walked = sys.getsizeof(cache.entries) + sum(
+        sys.getsizeof(key) + sys.getsizeof({}) + sum(map(sys.getsizeof, e.values()))
+        for key, e in cache.entries.items()
+    )
+    assert cache.memory_size() == walked
+
+    # learning a spell invalidates everything
+    cache.set_spellbook(casts | {Cast(1, (0, 1, 0, 0), True, False)})
+    assert not cache.entries
+
+
+def test_search_cache_next_turns():
+    witch = Witch(
+        (3, 0, 0, 0),
+        frozenset(
+            [
+                Cast(777, (2, 0, 0, 0), castable=True, repeatable=False),
+                Cast(888, (-1, 1, 0, 0), castable=True, repeatable=False),
+                Cast(999, (0, -1, 1, 0), castable=True, repeatable=False),
+                Cast(555, (-2, 2, 0, 0), castable=True, repeatable=True),
+            ]
+        ),
+    )
+    brews = [Brew(1, (0, 0, -2, 0), 10), Brew(2, (0, -3, 0, 0), 8)]
+    cache = SearchCache()
+    cache.set_spellbook(witch.casts)
+    distance = None
+    for turn in range(4):
+        result = cached_fastest_brew(cache, witch, brews, [], 1e18)
+        assert isinstance(result, BfsPlan)
+        if distance is not None:
+            assert result.distance == distance - 1
+        distance = result.distance
+        if isinstance(result.first, BfsCast):
+            for _ in range(result.first.num):
+                witch = witch.cast(result.first.cast)
+        else:
+            witch = witch.rest()
+    # only the first turn searched, the next positions were on its path
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_cached_fastest_brew_learn():
+    witch = Witch(
+        (3, 0, 0, 0),
+        frozenset(
+            [
+                Cast(777, (2, 0, 0, 0), castable=True, repeatable=False),
+                Cast(555, (-2, 2, 0, 0), castable=False, repeatable=True),
+            ]
+        ),
+    )
+    brews = [Brew(action_id=111, delta=(0, -4, 0, 0), price=10)]
+    learn = Learn(
+        action_id=5, delta=(0, 4, 0, 0), tome_index=0, tax_count=0, repeatable=False
+    )
+    cache = SearchCache()
+    cache.set_spellbook(witch.casts)
+    result = cached_fastest_brew(cache, witch, brews, [learn], 1e18)
+    assert isinstance(result, BfsPlan)
+    assert result.first == learn
+    assert result.distance == 2
+    assert result.brew == brews[0]
+
+
+def test_tables_blob_up_to_date():
+    assert TABLES.data == build_tables.build_tables(), "run python build_tables.py"
+    assert len(INVENTORIES) == 1001
+    assert len(TABLES.spells) == 4 + 42
+    assert len(TABLES.recipes) == 36
+
+
+def test_tables_rows():
+    for delta in [(2, 0, 0, 0), (-3, 0, 0, 1), (1, 1, 3, -2), (7, 0, -1, 0)]:
+        expected = [
+            INVENTORY_INDEX.get(add_inventories(inv, delta), -1) for inv in INVENTORIES
+        ]
+        assert list(transition_row(delta)) == expected
+    for delta in [(0, -2, -2, 0), (-1, -1, -1, -3), (0, 0, -7, 0)]:
+        expected_brew = [
+            all(i >= -d for i, d in zip(inv, delta)) for inv in INVENTORIES
+        ]
+        assert list(map(bool, brew_row(delta))) == expected_brew
+
+
 if __name__ == "__main__":
     # test_bfs()
     test_bfs()